@@ -7,7 +7,6 @@ This script runs scheduled synchronization tasks to keep the database updated.
 import schedule
 import time
 import logging
-import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -23,25 +22,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_sync_command(command, description):
-    """Run a synchronization command and log the results."""
+# Import after logging is configured so this script's handlers take effect.
+# Make the project root importable when run as `python scripts/automated_sync.py`
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.tmdb_client import get_client
+from src.etl.update_tmdb_data import TMDBUpdater
+
+def run_sync_task(task, description):
+    """Run a synchronization task against a TMDBUpdater and log the results."""
     try:
         logger.info(f"Starting: {description}")
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
-        
-        if result.returncode == 0:
-            logger.info(f"Successfully completed: {description}")
-            if result.stdout:
-                logger.info(f"Output: {result.stdout}")
-        else:
-            logger.error(f"Failed: {description}")
-            logger.error(f"Error: {result.stderr}")
+        with TMDBUpdater(client=get_client()) as updater:
+            result = task(updater)
+        logger.info(f"Successfully completed: {description}")
+        logger.info(f"Result: {result}")
             
     except Exception as e:
         logger.error(f"Exception running {description}: {str(e)}")
@@ -52,14 +47,14 @@ def daily_update():
     logger.info("Starting daily TMDB synchronization")
     
     # Update existing movies
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --update --batch-size 100",
+    run_sync_task(
+        lambda updater: updater.update_all_movies(batch_size=100),
         "Update existing movies"
     )
     
     # Add new movies from the last day
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --add-new-movies --time-period day",
+    run_sync_task(
+        lambda updater: updater.add_new_movies(time_period='day'),
         "Add new movies from the last day"
     )
     
@@ -72,14 +67,14 @@ def weekly_update():
     logger.info("Starting weekly TMDB synchronization")
     
     # Update existing movies
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --update --batch-size 100",
+    run_sync_task(
+        lambda updater: updater.update_all_movies(batch_size=100),
         "Update existing movies"
     )
     
     # Add new movies from the last week
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --add-new-movies --time-period week",
+    run_sync_task(
+        lambda updater: updater.add_new_movies(time_period='week'),
         "Add new movies from the last week"
     )
     
@@ -92,14 +87,14 @@ def monthly_update():
     logger.info("Starting monthly TMDB synchronization")
     
     # Update existing movies
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --update --batch-size 100",
+    run_sync_task(
+        lambda updater: updater.update_all_movies(batch_size=100),
         "Update existing movies"
     )
     
     # Add new movies from the last month
-    run_sync_command(
-        "python -m src.etl.update_tmdb_data --add-new-movies --time-period month",
+    run_sync_task(
+        lambda updater: updater.add_new_movies(time_period='month'),
         "Add new movies from the last month"
     )
     
@@ -1,21 +1,13 @@
-from dotenv import load_dotenv
 import os
-from sqlalchemy import create_engine
+from src.database.db_manager import get_engine
 
 def create_db_engine():
-    load_dotenv()
+    # Same process-wide engine (and pool) as DatabaseManager; configuration lives in get_engine()
+    engine = get_engine()
 
-    SQL_HOST = os.getenv("SQL_HOST")
-    SQL_PORT = os.getenv("SQL_PORT")
-    SQL_USER = os.getenv("SQL_USER")
-    SQL_PASS = os.getenv("SQL_PASS")
-    SQL_DB   = os.getenv("SQL_DB")
-
-    DATABASE_URL = f"mysql+pymysql://{SQL_USER}:{SQL_PASS}@{SQL_HOST}:{SQL_PORT}/{SQL_DB}"
-
-    engine = create_engine(DATABASE_URL)
-
-    with engine.connect() as conn:
-        print("✅ Successful connection")
+    # Only open a test connection when debugging to avoid a round-trip on import
+    if os.getenv("DEBUG"):
+        with engine.connect() as conn:
+            print("✅ Successful connection")
 
     return engine
@@ -0,0 +1,48 @@
+import os
+import time
+import logging
+from typing import Optional
+import redis
+
+logger = logging.getLogger(__name__)
+
+class RedisRateLimiter:
+    """Fixed one-second window request counter shared by every process using the same Redis."""
+
+    def __init__(self, url: str, max_requests_per_second: int, prefix: str = 'tmdb:rl:'):
+        """Connect to Redis; windows are stored under prefix + unix second."""
+        self.client = redis.Redis.from_url(url)
+        self.max_requests_per_second = max_requests_per_second
+        self.prefix = prefix
+
+    def try_acquire(self) -> float:
+        """Claim a request slot in the current window.
+
+        Returns 0 if the request may proceed, otherwise the seconds until the next window.
+        If Redis is unreachable the request proceeds, limited only by the in-process window.
+        """
+        now = time.time()
+        window = int(now)
+        key = f"{self.prefix}{window}"
+        try:
+            pipe = self.client.pipeline()  # MULTI/EXEC, so INCR and EXPIRE apply atomically
+            pipe.incr(key)
+            pipe.expire(key, 2)
+            count, _ = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Shared rate limiter unavailable: {str(e)}")
+            return 0
+        if count <= self.max_requests_per_second:
+            return 0
+        return window + 1 - now
+
+    def close(self):
+        """Release the Redis connection pool."""
+        self.client.close()
+
+def create_rate_limiter(max_requests_per_second: int) -> Optional[RedisRateLimiter]:
+    """Share the request budget through Redis when REDIS_URL is set, otherwise None."""
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        return RedisRateLimiter(redis_url, max_requests_per_second)
+    return None
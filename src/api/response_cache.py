@@ -0,0 +1,92 @@
+import os
+import hashlib
+import logging
+import threading
+from typing import Any, List, Optional
+import orjson
+import redis
+import zstandard
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'  # Frame header; entries without it predate compression
+
+class DiskCache(Cache):
+    """On-disk response cache with the same batch lookup as RedisCache."""
+
+    def get_many(self, keys: List[Any], default: Any = None) -> List[Any]:
+        """Get several entries, in key order."""
+        return [self.get(key, default) for key in keys]
+
+class RedisCache:
+    """Redis-backed response cache exposing the get/get_many/set/close subset of diskcache.Cache."""
+
+    def __init__(self, url: str, prefix: str = 'tmdb:'):
+        """Connect to Redis; keys are namespaced with prefix."""
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.compression_level = 3  # zstd level; JSON bodies shrink several-fold at this level
+        self.codecs = threading.local()  # zstd (de)compressors must not be shared between threads
+
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        """Get this thread's reusable zstd compressor."""
+        if not hasattr(self.codecs, 'compressor'):
+            self.codecs.compressor = zstandard.ZstdCompressor(level=self.compression_level)
+        return self.codecs.compressor
+
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        """Get this thread's reusable zstd decompressor."""
+        if not hasattr(self.codecs, 'decompressor'):
+            self.codecs.decompressor = zstandard.ZstdDecompressor()
+        return self.codecs.decompressor
+
+    def _key(self, key: Any) -> str:
+        """Hash an arbitrary (endpoint, params) cache key into a fixed-size Redis key."""
+        return self.prefix + hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def _decode(self, raw: bytes) -> tuple:
+        """Decode a stored value back into its entry tuple."""
+        if raw.startswith(ZSTD_MAGIC):
+            raw = self._decompressor().decompress(raw)
+        return tuple(orjson.loads(raw))  # Entries are stored as tuples, JSON gives lists back
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a cached entry, or default on a miss or when Redis is unreachable."""
+        try:
+            raw = self.client.get(self._key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read failed: {str(e)}")
+            return default
+        return default if raw is None else self._decode(raw)
+
+    def get_many(self, keys: List[Any], default: Any = None) -> List[Any]:
+        """Get several entries in one MGET round trip, in key order."""
+        if not keys:
+            return []
+        try:
+            raws = self.client.mget([self._key(key) for key in keys])
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache read failed: {str(e)}")
+            return [default] * len(keys)
+        return [default if raw is None else self._decode(raw) for raw in raws]
+
+    def set(self, key: Any, value: Any, expire: Optional[float] = None):
+        """Store an entry, expiring it after expire seconds."""
+        try:
+            raw = self._compressor().compress(orjson.dumps(value))
+            self.client.set(self._key(key), raw, ex=int(expire) if expire else None)
+        except redis.RedisError as e:
+            logger.warning(f"Redis cache write failed: {str(e)}")
+
+    def close(self):
+        """Release the Redis connection pool."""
+        self.client.close()
+
+def create_response_cache(cache_dir: str):
+    """Use Redis when REDIS_URL is set, otherwise fall back to the on-disk cache."""
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        logger.info("Using Redis response cache")
+        return RedisCache(redis_url)
+    return DiskCache(cache_dir)
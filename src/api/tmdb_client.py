@@ -1,17 +1,24 @@
 import os
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from functools import lru_cache
+import asyncio
 import requests
+import httpx
+import orjson
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from datetime import datetime
-from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from tqdm import tqdm
+from cachetools import LRUCache
 # load .senv
 from dotenv import load_dotenv
 import threading
+from collections import deque
+from src.api.response_cache import create_response_cache
+from src.api.rate_limiter import create_rate_limiter
 load_dotenv()
 
 # Configure logging
@@ -28,14 +35,16 @@ logger = logging.getLogger(__name__)
 class TMDBClient:
     """Client for interacting with TMDB API."""
     
-    def __init__(self):
-        """Initialize TMDB client with API key."""
-        self.api_key = os.getenv('API_KEY')
+    def __init__(self, max_requests_per_second: int = 40):
+        """Initialize TMDB client with API key.
+        
+        Args:
+            max_requests_per_second: Request budget shared by all threads and coroutines;
+                lower it if TMDB starts answering with 429s.
+        """
         self.base_url = os.getenv('BASE_URL', 'https://api.themoviedb.org/3')
-        self.bearer_token = os.getenv('TMDB_BEARER_TOKEN')
+        self.bearer_token = os.getenv('TMDB_BEARER_TOKEN')  # All requests authenticate with this
         
-        if not self.api_key:
-            raise ValueError("API_KEY environment variable not set")
         if not self.bearer_token:
             raise ValueError("TMDB_BEARER_TOKEN environment variable not set")
         
@@ -47,7 +56,7 @@ class TMDBClient:
             total=3,  # Reduced retries
             backoff_factor=0.1,  # Reduced backoff time
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
+            allowed_methods=["GET"]  # The client only issues GETs
         )
         
         # Mount the adapter with retry strategy and optimized pool
@@ -59,22 +68,43 @@ class TMDBClient:
         )
         self.session.mount("https://", adapter)
         
-        # Set headers
-        self.session.headers.update({
+        # Set headers (shared with the async HTTP/2 client)
+        self.headers = {
             'Authorization': f'Bearer {self.bearer_token}',
             'accept': 'application/json'
-        })
+        }
+        self.session.headers.update(self.headers)
         
         # Rate limiting
-        self.request_times = []
-        self.max_requests_per_second = 40  # Increased rate limit
+        self.request_times = deque()
+        self.max_requests_per_second = max_requests_per_second
+        self.rate_lock = threading.Lock()
+        self.shared_rate_limiter = create_rate_limiter(max_requests_per_second)  # Cross-process, needs REDIS_URL
+        self.page_workers = 20  # Max concurrent requests (and connections) for async batch fetching
+        self.max_api_pages = 500  # TMDB rejects page numbers above 500
+        
+        # Persistent response cache (Redis if REDIS_URL is set, else on disk), shared across processes and runs
+        self.cache_ttl = 3600  # Default cache TTL in seconds
+        self.cache_ttls = {  # Per-endpoint TTLs, matched by endpoint prefix (most specific first)
+            'movie/changes': 60,  # Change feed must stay current
+            'discover/movie': 86400,
+            'search/movie': 86400,
+            'movie/': 86400,  # Details, credits, release dates, keywords...
+            'person/': 86400,
+            'configuration': 7 * 86400,
+        }
+        self.revalidate_ttl = 7 * 86400  # Keep stale bodies this long for ETag revalidation
+        self.serve_stale = os.getenv('SERVE_STALE') == '1'  # Fall back to stale cache entries on API errors
+        self.cache_dir = os.getenv('TMDB_CACHE_DIR', 'data/cache/tmdb')
+        self.request_cache = create_response_cache(self.cache_dir)
         
-        # Thread-safe caching
-        self.request_cache = {}
-        self.cache_ttl = 3600  # Cache TTL in seconds
-        self.cache_lock = threading.Lock()
-        self.last_cache_cleanup = time.time()
-        self.cache_cleanup_interval = 300  # Clean cache every 5 minutes
+        # Per-instance in-memory LRUs for detail lookups (method-level lru_cache would pin self)
+        self.movie_cache = LRUCache(maxsize=10000)  # Details with credits appended
+        self.person_cache = LRUCache(maxsize=10000)
+        self.detail_cache_lock = threading.Lock()
+        self.inflight = {}  # cache_key -> Future for requests currently being fetched
+        self.inflight_lock = threading.Lock()
+        self.movie_params = {'append_to_response': 'credits'}  # One request per movie for details + credits
         
         # Test connection
         try:
@@ -86,76 +116,312 @@ class TMDBClient:
             logger.error(f"Failed to initialize TMDB client: {str(e)}")
             raise
 
-    def _cleanup_cache(self):
-        """Clean up expired cache entries."""
-        now = time.time()
-        if now - self.last_cache_cleanup > self.cache_cleanup_interval:
-            with self.cache_lock:
-                self.request_cache = {k: v for k, v in self.request_cache.items() 
-                                    if now - v[0] < self.cache_ttl}
-                self.last_cache_cleanup = now
-
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict]:
-        """Get data from cache in a thread-safe way."""
-        with self.cache_lock:
-            if cache_key in self.request_cache:
-                cache_time, cache_data = self.request_cache[cache_key]
-                if time.time() - cache_time < self.cache_ttl:
-                    return cache_data
+    def close(self):
+        """Close the pooled HTTP session, the response cache and the shared rate limiter."""
+        self.session.close()
+        self.request_cache.close()
+        if self.shared_rate_limiter:
+            self.shared_rate_limiter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _ttl_for(self, endpoint: str) -> int:
+        """Get the cache TTL for an endpoint from cache_ttls, defaulting to cache_ttl."""
+        for prefix, ttl in self.cache_ttls.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return self.cache_ttl
+
+    def _cache_key(self, endpoint: str, params: Optional[Dict]) -> Tuple:
+        """Build the response-cache key for an endpoint and its params."""
+        return (endpoint, tuple(sorted(params.items())) if params else ())
+
+    def _is_fresh(self, entry: Optional[Tuple]) -> bool:
+        """Check whether a cache entry can be served without revalidation."""
+        return isinstance(entry, tuple) and time.time() < entry[0]
+
+    def _get_from_cache(self, cache_key: Tuple) -> Optional[Dict]:
+        """Get fresh data from the response cache (thread- and process-safe)."""
+        entry = self.request_cache.get(cache_key)
+        return entry[3] if self._is_fresh(entry) else None
+
+    def _get_validators(self, entry: Optional[Tuple]) -> Dict[str, str]:
+        """Get conditional-request headers for a (possibly stale) cache entry."""
+        if not isinstance(entry, tuple):
+            return {}
+        _, etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _get_stale(self, cache_key: Tuple) -> Optional[Dict]:
+        """Get an expired-but-retained cache entry when SERVE_STALE is enabled."""
+        if not self.serve_stale:
+            return None
+        entry = self.request_cache.get(cache_key)
+        if isinstance(entry, tuple):
+            logger.warning(f"Serving stale cached response for {cache_key[0]}")
+            return entry[3]
         return None
 
-    def _add_to_cache(self, cache_key: str, data: Dict):
-        """Add data to cache in a thread-safe way."""
-        with self.cache_lock:
-            self.request_cache[cache_key] = (time.time(), data)
+    def _add_to_cache(self, cache_key: Tuple, data: Dict,
+                      etag: str = None, last_modified: str = None):
+        """Add data to the response cache; it is served fresh for the endpoint's TTL.
+        
+        Entries carrying an ETag or Last-Modified validator (or any entry, with SERVE_STALE)
+        are kept for revalidate_ttl so a later request can be answered by a bodiless
+        304 Not Modified, or from the stale copy if the API is failing.
+        """
+        ttl = self._ttl_for(cache_key[0])
+        keep_stale = etag or last_modified or self.serve_stale
+        expire = max(ttl, self.revalidate_ttl) if keep_stale else ttl
+        self.request_cache.set(cache_key, (time.time() + ttl, etag, last_modified, data), expire=expire)
+
+    def _add_response_to_cache(self, cache_key: Tuple, data: Dict, response_headers,
+                               request_headers: Dict[str, str]):
+        """Cache a response with its validators, keeping the sent ones if a 304 omitted them."""
+        self._add_to_cache(cache_key, data,
+                           etag=response_headers.get('ETag') or request_headers.get('If-None-Match'),
+                           last_modified=response_headers.get('Last-Modified')
+                           or request_headers.get('If-Modified-Since'))
 
     def _rate_limit(self):
-        """Implement rate limiting."""
-        now = time.time()
-        # Remove requests older than 1 second
-        self.request_times = [t for t in self.request_times if now - t < 1]
-        
-        # If we've made too many requests in the last second, wait
-        if len(self.request_times) >= self.max_requests_per_second:
-            sleep_time = 1 - (now - self.request_times[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            # Clean up old requests again
-            self.request_times = [t for t in self.request_times if now - t < 1]
-        
-        # Add current request
-        self.request_times.append(now)
+        """Implement rate limiting (thread-safe, shared by parallel page workers)."""
+        while True:
+            with self.rate_lock:
+                now = time.time()
+                # Drop requests older than 1 second from the left of the window
+                while self.request_times and now - self.request_times[0] >= 1:
+                    self.request_times.popleft()
+                
+                # Claim a slot if the last second has room for one
+                if len(self.request_times) < self.max_requests_per_second:
+                    self.request_times.append(now)
+                    break
+                sleep_time = 1 - (now - self.request_times[0])
+            
+            # Wait outside the lock; _arate_limit takes it on the event loop thread
+            time.sleep(sleep_time)
+        
+        # Then claim a slot in the budget shared with other processes, if configured
+        if self.shared_rate_limiter:
+            while (delay := self.shared_rate_limiter.try_acquire()) > 0:
+                time.sleep(delay)
+
+    async def _arate_limit(self):
+        """Async rate limiting; shares the request window with _rate_limit."""
+        while True:
+            with self.rate_lock:
+                now = time.time()
+                while self.request_times and now - self.request_times[0] >= 1:
+                    self.request_times.popleft()
+                
+                if len(self.request_times) < self.max_requests_per_second:
+                    self.request_times.append(now)
+                    break
+                sleep_time = 1 - (now - self.request_times[0])
+            
+            # Wait outside the lock so other coroutines and threads are not blocked
+            await asyncio.sleep(sleep_time)
+        
+        if self.shared_rate_limiter:
+            while (delay := self.shared_rate_limiter.try_acquire()) > 0:
+                await asyncio.sleep(delay)
 
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make a request to the TMDB API with rate limiting and caching."""
+        """Make a request to the TMDB API with rate limiting and caching.
+        
+        Concurrent calls for the same endpoint and params share a single in-flight request.
+        """
+        # Check cache first
+        cache_key = self._cache_key(endpoint, params)
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            return cached_data
+        
+        with self.inflight_lock:
+            future = self.inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.inflight[cache_key] = future
+        if not is_leader:
+            return future.result()  # Another thread is already fetching this URL
+        
+        try:
+            data = self._request(endpoint, params, cache_key)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self.inflight_lock:
+                del self.inflight[cache_key]
+
+    def _request(self, endpoint: str, params: Optional[Dict], cache_key: Tuple) -> Optional[Dict]:
+        """Fetch an uncached response from the TMDB API and store it in the cache."""
         try:
-            # Check cache first
-            cache_key = f"{endpoint}:{str(params)}"
-            cached_data = self._get_from_cache(cache_key)
-            if cached_data:
-                return cached_data
-            
             self._rate_limit()  # Apply rate limiting
             
+            # Revalidate a stale cached copy instead of re-downloading it
+            stale_entry = self.request_cache.get(cache_key)
+            headers = self._get_validators(stale_entry)
+            
             url = f"{self.base_url}/{endpoint}"
-            response = self.session.get(url, params=params, timeout=5)  # Added timeout
+            response = self.session.get(url, params=params, headers=headers, timeout=5)  # Added timeout
             response.raise_for_status()
-            data = response.json()
+            if response.status_code == 304 and isinstance(stale_entry, tuple):
+                data = stale_entry[3]  # Not Modified: reuse the cached body, nothing to parse
+            else:
+                data = orjson.loads(response.content)  # C-level parse of the raw body
             
             # Cache the response
-            self._add_to_cache(cache_key, data)
-            
-            # Periodically clean up cache
-            self._cleanup_cache()
+            self._add_response_to_cache(cache_key, data, response.headers, headers)
             
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {str(e)}")
+            return self._get_stale(cache_key)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from {endpoint}: {str(e)}")
             return None
     
-    def get_movie_ids(self, since_id: int = None, test_year: int = None) -> List[int]:
-        """Get all movie IDs from TMDB, year by year."""
-        movie_ids = set()  # Use set to avoid duplicates
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honouring a numeric Retry-After header."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return 0.1 * (2 ** attempt)
+
+    async def _afetch(self, client: httpx.AsyncClient, endpoint: str, params: Optional[Dict],
+                      stale_entry: Optional[Tuple]) -> Optional[Dict]:
+        """Async counterpart of _make_request over a shared HTTP/2 client.
+        
+        The caller has already looked up the cache; stale_entry is the (possibly expired)
+        entry found there, used to revalidate instead of re-downloading.
+        """
+        cache_key = self._cache_key(endpoint, params)
+        try:
+            await self._arate_limit()
+            
+            headers = self._get_validators(stale_entry)
+            
+            url = f"{self.base_url}/{endpoint}"
+            response = await client.get(url, params=params, headers=headers)
+            
+            # Mirror the sync session's Retry policy for throttling / server errors,
+            # backing off for as long as TMDB asks via Retry-After when it sends one
+            retries = 0
+            while response.status_code in (429, 500, 502, 503, 504) and retries < 3:
+                retries += 1
+                await asyncio.sleep(self._retry_delay(response, retries))
+                await self._arate_limit()
+                response = await client.get(url, params=params, headers=headers)
+            if response.status_code == 304 and isinstance(stale_entry, tuple):
+                data = stale_entry[3]  # Not Modified: reuse the cached body, nothing to parse
+            else:
+                response.raise_for_status()  # httpx treats 304 as an error, so check it first
+                data = orjson.loads(response.content)
+            
+            self._add_response_to_cache(cache_key, data, response.headers, headers)
+            
+            return data
+        except httpx.HTTPError as e:
+            logger.error(f"API request failed: {str(e)}")
+            return self._get_stale(cache_key)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from {endpoint}: {str(e)}")
+            return None
+
+    async def _afetch_all(self, calls: List[Tuple[str, Optional[Dict]]],
+                          desc: str = None) -> List[Optional[Dict]]:
+        """Fetch many (endpoint, params) requests concurrently over one HTTP/2 connection.
+        
+        The cache is checked for all calls in one batch lookup (a single MGET on Redis), then
+        a fixed pool of page_workers coroutines drains a queue of the misses, so at most that
+        many requests are in flight (HTTP/2 would otherwise multiplex them all onto one connection).
+        Results are returned in request order (None for requests that failed).
+        """
+        results = [None] * len(calls)
+        entries = self.request_cache.get_many([self._cache_key(endpoint, params)
+                                               for endpoint, params in calls])
+        queue = asyncio.Queue()
+        for index, (call, entry) in enumerate(zip(calls, entries)):
+            if self._is_fresh(entry):
+                results[index] = entry[3]
+            else:
+                queue.put_nowait((index, call, entry))
+        if queue.empty():
+            return results
+        
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,  # Retries connection failures
+            limits=httpx.Limits(max_connections=self.page_workers)
+        )
+        async with httpx.AsyncClient(transport=transport, headers=self.headers, timeout=5) as client:
+            with tqdm(total=queue.qsize(), desc=desc, leave=False) as pbar:
+                async def worker():
+                    while not queue.empty():
+                        index, (endpoint, params), entry = queue.get_nowait()
+                        results[index] = await self._afetch(client, endpoint, params, entry)
+                        pbar.update(1)
+                
+                workers = min(self.page_workers, queue.qsize())
+                await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        return results
+
+    async def _afetch_pages(self, endpoint: str, params: Dict, pages: range,
+                            desc: str = None) -> List[Optional[Dict]]:
+        """Fetch pages of a paginated endpoint concurrently, in page order."""
+        return await self._afetch_all([(endpoint, {**params, 'page': page}) for page in pages],
+                                      desc=desc)
+
+    def _extract_movie_ids(self, data: Dict, since_id: int = None) -> set:
+        """Extract movie IDs from a discover/movie page, skipping IDs <= since_id."""
+        min_id = since_id or 0
+        return {movie['id'] for movie in data.get('results', []) if (movie.get('id') or 0) > min_id}
+
+    def _paginate(self, endpoint: str, params: Dict, max_pages: int,
+                  desc: str = None) -> Iterator[Dict]:
+        """Yield pages of a paginated TMDB endpoint, in page order.
+        
+        Page 1 is fetched first to learn total_pages, which is clamped to max_pages and
+        to TMDB's hard cap; the remaining pages are then fetched concurrently over HTTP/2.
+        Stops early if page 1 has no results, and skips pages that come back empty.
+        """
+        first_page = self._make_request(endpoint, {**params, 'page': 1})
+        if not first_page or not first_page.get('results'):
+            return
+        yield first_page
+        
+        total_pages = min(first_page.get('total_pages', 1), max_pages, self.max_api_pages)
+        if total_pages < 2:
+            return
+        
+        pages = asyncio.run(self._afetch_pages(endpoint, params, range(2, total_pages + 1), desc))
+        for data in pages:
+            if data and data.get('results'):
+                yield data
+
+    def iter_movie_ids(self, since_id: int = None, test_year: int = None) -> Iterator[int]:
+        """Yield unique movie IDs from TMDB, year by year, as pages are fetched.
+        
+        Each movie has a single primary release year, so duplicates (from popularity
+        order shifting between page fetches) can only occur within a year; only that
+        year's IDs are kept in memory for deduplication.
+        """
+        total_found = 0
         max_pages = 300  # Reduced from 500 to 300
         
         try:
@@ -172,7 +438,8 @@ class TMDBClient:
                     'include_video': False
                 }
                 earliest_data = self._make_request('discover/movie', earliest_params)
-                earliest_year = datetime.strptime(earliest_data['results'][0]['release_date'], '%Y-%m-%d').year
+                # TMDB dates are always YYYY-MM-DD, so slice the year instead of strptime
+                earliest_year = int(earliest_data['results'][0]['release_date'][:4])
                 
                 # Set latest year to 2023 for initial data load
                 latest_year = 2023
@@ -184,138 +451,124 @@ class TMDBClient:
             for year in years_to_process:
                 logger.info(f"Fetching movies from year {year}")
                 
-                # Get total pages for this year
                 year_params = {
                     'primary_release_year': year,
                     'sort_by': 'popularity.desc',  # Only use popularity sorting
-                    'page': 1,
                     'include_adult': False,
                     'include_video': False
                 }
-                year_data = self._make_request('discover/movie', year_params)
-                total_pages = min(year_data.get('total_pages', 0), max_pages)
                 
-                # Create progress bar for this year
-                with tqdm(total=total_pages, desc=f"Pages for {year}", leave=False) as pbar:
-                    page = 1
-                    while page <= total_pages:
-                        try:
-                            params = {
-                                'primary_release_year': year,
-                                'sort_by': 'popularity.desc',
-                                'page': page,
-                                'include_adult': False,
-                                'include_video': False
-                            }
-                            
-                            data = self._make_request('discover/movie', params)
-                            if not data or not data.get('results'):
-                                break
-                            
-                            # Extract movie IDs
-                            for movie in data.get('results', []):
-                                movie_id = movie.get('id')
-                                if movie_id:
-                                    if since_id and movie_id <= since_id:
-                                        continue
-                                    movie_ids.add(movie_id)
-                            
-                            page += 1
-                            pbar.update(1)
-                            
-                        except Exception as e:
-                            logger.error(f"Error getting movies for year {year}: {str(e)}")
-                            break
+                # Stream IDs from all pages for this year
+                seen = set()  # Avoid yielding duplicates across this year's pages
+                for data in self._paginate('discover/movie', year_params, max_pages,
+                                           desc=f"Pages for {year}"):
+                    for movie_id in self._extract_movie_ids(data, since_id):
+                        if movie_id not in seen:
+                            seen.add(movie_id)
+                            yield movie_id
+                total_found += len(seen)
         
         except Exception as e:
             logger.error(f"Error getting year range: {str(e)}")
-            return list(movie_ids)
         
-        # Convert set to sorted list
-        movie_ids = sorted(list(movie_ids))
-        logger.info(f"Found {len(movie_ids)} unique movies to process")
-        return movie_ids
+        logger.info(f"Found {total_found} unique movies to process")
+
+    def get_movie_ids(self, since_id: int = None, test_year: int = None) -> List[int]:
+        """Get all movie IDs from TMDB as a list (in discovery order, not sorted)."""
+        return list(self.iter_movie_ids(since_id=since_id, test_year=test_year))
 
     def _fetch_movies_for_year(self, year: int, sort_by: str, since_id: int = None) -> set:
         """Fetch movies for a specific year and sort criteria."""
         movie_ids = set()
         max_pages = 300  # Reduced from 500 to 300
-        page = 1
         
         try:
-            # Get total pages for this year and sort criteria
             year_params = {
                 'primary_release_year': year,
                 'sort_by': sort_by,
-                'page': 1,
                 'include_adult': False,
                 'include_video': False
             }
-            year_data = self._make_request('discover/movie', year_params)
-            total_pages = min(year_data.get('total_pages', 0), max_pages)
             
-            # Create progress bar for this year and sort criteria
-            with tqdm(total=total_pages, desc=f"Pages for {year} ({sort_by})", leave=False) as pbar:
-                while page <= total_pages:
-                    try:
-                        params = {
-                            'primary_release_year': year,
-                            'sort_by': sort_by,
-                            'page': page,
-                            'include_adult': False,
-                            'include_video': False
-                        }
-                        
-                        data = self._make_request('discover/movie', params)
-                        if not data or not data.get('results'):
-                            break
-                        
-                        # Extract movie IDs
-                        for movie in data.get('results', []):
-                            movie_id = movie.get('id')
-                            if movie_id:
-                                if since_id and movie_id <= since_id:
-                                    continue
-                                movie_ids.add(movie_id)
-                        
-                        page += 1
-                        pbar.update(1)
-                        
-                        # Reduced delay between requests
-                        time.sleep(0.01)  # 10ms delay between requests
-                        
-                    except Exception as e:
-                        logger.error(f"Error getting movies for year {year} with sort {sort_by}: {str(e)}")
-                        break
+            for data in self._paginate('discover/movie', year_params, max_pages,
+                                       desc=f"Pages for {year} ({sort_by})"):
+                movie_ids |= self._extract_movie_ids(data, since_id)
         
         except Exception as e:
             logger.error(f"Error getting data for year {year} with sort {sort_by}: {str(e)}")
         
         return movie_ids
     
-    @lru_cache(maxsize=10000)  # increased cache size
+    def _get_detail(self, cache: LRUCache, item_id: int, endpoint: str,
+                    params: Dict = None) -> Optional[Dict]:
+        """Fetch a detail endpoint through a per-instance in-memory LRU (L1 over the response cache)."""
+        with self.detail_cache_lock:
+            if item_id in cache:
+                return cache[item_id]
+        
+        data = self._make_request(endpoint, params)
+        if data is not None:
+            with self.detail_cache_lock:
+                cache[item_id] = data
+        return data
+
+    def _get_details_many(self, cache: LRUCache, item_ids: List[int], endpoint_format: str,
+                          params: Dict = None, desc: str = None) -> Dict[int, Optional[Dict]]:
+        """Fetch a detail endpoint for many IDs concurrently, reusing the in-memory LRU."""
+        results = {}
+        with self.detail_cache_lock:
+            for item_id in item_ids:
+                if item_id in cache:
+                    results[item_id] = cache[item_id]
+        
+        missing = [item_id for item_id in item_ids if item_id not in results]
+        if missing:
+            fetched = asyncio.run(self._afetch_all(
+                [(endpoint_format.format(item_id), params) for item_id in missing],
+                desc=desc
+            ))
+            with self.detail_cache_lock:
+                for item_id, data in zip(missing, fetched):
+                    results[item_id] = data
+                    if data is not None:
+                        cache[item_id] = data
+        
+        return results
+
+    def get_movie_details_many(self, movie_ids: List[int]) -> Dict[int, Optional[Dict]]:
+        """Get detailed information for many movies concurrently, keyed by movie ID."""
+        return self._get_details_many(self.movie_cache, movie_ids, 'movie/{}',
+                                      params=self.movie_params, desc="Movie details")
+
+    def get_movie_credits_many(self, movie_ids: List[int]) -> Dict[int, Optional[Dict]]:
+        """Get cast and crew information for many movies concurrently, keyed by movie ID.
+        
+        Credits are appended to the details response, so this reuses get_movie_details_many.
+        """
+        details = self.get_movie_details_many(movie_ids)
+        return {movie_id: data.get('credits') if data else None for movie_id, data in details.items()}
+
     def get_movie_details(self, movie_id: int) -> Optional[Dict]:
-        """Get detailed information about a movie."""
+        """Get detailed information about a movie (with its credits under 'credits')."""
         try:
-            return self._make_request(f'movie/{movie_id}')
+            return self._get_detail(self.movie_cache, movie_id, f'movie/{movie_id}', self.movie_params)
         except Exception as e:
             logger.error(f"Error getting movie details for ID {movie_id}: {str(e)}")
             return None
     
-    @lru_cache(maxsize=10000)  # increased cache size
     def get_movie_credits(self, movie_id: int) -> Optional[Dict]:
-        """Get cast and crew information for a movie."""
+        """Get cast and crew information for a movie, from the appended details response."""
         try:
-            return self._make_request(f'movie/{movie_id}/credits')
+            movie_data = self.get_movie_details(movie_id)
+            return movie_data.get('credits') if movie_data else None
         except Exception as e:
             logger.error(f"Error getting credits for movie ID {movie_id}: {str(e)}")
             return None
 
-    @lru_cache(maxsize=10000)  # increased cache size
     def get_person(self, person_id: int) -> Optional[Dict]:
         """Get detailed information about a person."""
         try:
-            return self._make_request(f'person/{person_id}')
+            return self._get_detail(self.person_cache, person_id, f'person/{person_id}')
         except Exception as e:
             logger.error(f"Error getting person details for ID {person_id}: {str(e)}")
             return None
@@ -354,6 +607,42 @@ class TMDBClient:
             logger.error(f"Error searching for movie '{query}': {str(e)}")
             return []
 
+    def get_changed_movie_ids(self, start_date: datetime) -> Optional[set]:
+        """Get IDs of movies changed on TMDB since start_date (at most the last 14 days).
+        
+        Returns None if the change feed could not be read, so callers can fall back
+        to a full refresh instead of treating it as "nothing changed".
+        """
+        try:
+            params = {
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': datetime.now().strftime('%Y-%m-%d')
+            }
+            first_page = self._make_request('movie/changes', {**params, 'page': 1})
+            if first_page is None:
+                return None
+            
+            # A partial set would make callers skip movies that did change, so it is all or nothing
+            total_pages = first_page.get('total_pages', 1)
+            if total_pages > self.max_api_pages:
+                logger.warning(f"Change feed has {total_pages} pages, more than the {self.max_api_pages} TMDB serves")
+                return None
+            
+            changed_ids = self._extract_movie_ids(first_page)
+            if total_pages > 1:
+                pages = asyncio.run(self._afetch_pages('movie/changes', params, range(2, total_pages + 1),
+                                                       "Changed movies"))
+                if any(page is None for page in pages):
+                    logger.warning("Some change feed pages could not be fetched")
+                    return None
+                for page in pages:
+                    changed_ids |= self._extract_movie_ids(page)
+            return changed_ids
+            
+        except Exception as e:
+            logger.error(f"Error getting movie changes since {start_date}: {str(e)}")
+            return None
+
     def get_movies_since_date(self, start_date: datetime) -> List[Dict]:
         """Get movies released since a specific date.
         
@@ -365,34 +654,34 @@ class TMDBClient:
         """
         try:
             movies = []
-            page = 1
-            total_pages = 1
+            max_pages = 20  # Only the most recent releases are needed
             
-            # Format date for API
-            start_date_str = start_date.strftime('%Y-%m-%d')
+            params = {
+                'primary_release_date.gte': start_date.strftime('%Y-%m-%d'),  # Format date for API
+                'sort_by': 'release_date.desc',
+                'include_adult': False,
+                'include_video': False
+            }
             
-            while page <= total_pages:
-                params = {
-                    'primary_release_date.gte': start_date_str,
-                    'sort_by': 'release_date.desc',
-                    'page': page,
-                    'include_adult': False,
-                    'include_video': False
-                }
-                
-                response = self._make_request('discover/movie', params)
-                if not response or 'results' not in response:
-                    break
-                    
-                movies.extend(response['results'])
-                total_pages = min(response.get('total_pages', 1), 20)  # Limit to 20 pages
-                page += 1
-                
-                # Add a small delay between requests
-                time.sleep(0.1)
+            # TMDB can repeat a movie across page boundaries when the ordering shifts mid-walk
+            seen_ids = set()
+            for response in self._paginate('discover/movie', params, max_pages):
+                for movie in response['results']:
+                    if movie['id'] not in seen_ids:
+                        seen_ids.add(movie['id'])
+                        movies.append(movie)
             
             return movies
             
         except Exception as e:
             logger.error(f"Error getting movies since {start_date}: {str(e)}")
-            return [] 
\ No newline at end of file
+            return [] 
+
+@lru_cache(maxsize=1)
+def get_client() -> TMDBClient:
+    """Return the process-wide TMDB client, creating it on first use.
+    
+    Sharing one client keeps its connection pool, in-memory caches and rate-limit window
+    warm across callers; callers must not close it.
+    """
+    return TMDBClient()
@@ -1,6 +1,10 @@
 import os
+import time
 import logging
-from sqlalchemy import create_engine
+import importlib.util
+from functools import lru_cache
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
@@ -19,37 +23,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Get the process-wide pooled engine, creating it on first use."""
+    # Get database configuration from environment variables
+    db_host = os.getenv('SQL_HOST')
+    db_port = os.getenv('SQL_PORT')
+    db_user = os.getenv('SQL_USER')
+    db_pass = os.getenv('SQL_PASS')
+    db_name = os.getenv('SQL_DB')
+    
+    if not all([db_host, db_port, db_user, db_pass, db_name]):
+        raise ValueError("Missing required database environment variables")
+    
+    # Construct database URL; prefer the mysqlclient C driver when installed, SQL_DRIVER overrides
+    db_driver = os.getenv('SQL_DRIVER') or ('mysqldb' if importlib.util.find_spec('MySQLdb') else 'pymysql')
+    database_url = f"mysql+{db_driver}://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}?charset=utf8mb4"
+    
+    # Create engine with connection pooling
+    return create_engine(
+        database_url,
+        poolclass=QueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,  # Recycle connections after 30 minutes
+        pool_pre_ping=True,  # Transparently replace connections MySQL has dropped
+        # LOAD DATA LOCAL INFILE must be allowed by the client too; opt-in since it lets the server request local files
+        connect_args={'local_infile': True} if os.getenv('SQL_LOCAL_INFILE') == '1' else {}
+    )
+
 class DatabaseManager:
     """Manages database connections and operations."""
     
     def __init__(self):
         """Initialize database connection."""
         try:
-            # Get database configuration from environment variables
-            db_host = os.getenv('SQL_HOST')
-            db_port = os.getenv('SQL_PORT')
-            db_user = os.getenv('SQL_USER')
-            db_pass = os.getenv('SQL_PASS')
-            db_name = os.getenv('SQL_DB')
+            # Every manager shares one engine (and its pool) per process
+            self.engine = get_engine()
             
-            if not all([db_host, db_port, db_user, db_pass, db_name]):
-                raise ValueError("Missing required database environment variables")
+            # Create session factory; bulk work shouldn't trigger implicit flushes or reloads after commit
+            self.Session = sessionmaker(bind=self.engine, expire_on_commit=False, autoflush=False)
             
-            # Construct database URL
-            database_url = f"mysql+pymysql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
-            
-            # Create engine with connection pooling
-            self.engine = create_engine(
-                database_url,
-                poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30,
-                pool_recycle=1800  # Recycle connections after 30 minutes
-            )
-            
-            # Create session factory
-            self.Session = sessionmaker(bind=self.engine)
+            self.connection_check_ttl = 5  # Seconds a successful check_connection is trusted for
+            self.last_connection_ok = None  # time.monotonic() of the last successful check
             
             logger.info("Database connection initialized successfully")
             
@@ -68,7 +85,10 @@ class DatabaseManager:
                 sql_commands = f.read()
             
             with self.engine.connect() as connection:
-                connection.execute(sql_commands)
+                # Drivers run one statement per execute, so split the file like create_schema does
+                for command in sql_commands.split(';'):
+                    if command.strip():
+                        connection.execute(text(command))
                 connection.commit()
             
             logger.info(f"Successfully executed SQL file: {file_path}")
@@ -78,10 +98,14 @@ class DatabaseManager:
             raise
     
     def check_connection(self) -> bool:
-        """Check if database connection is working."""
+        """Check if database connection is working, reusing a recent successful check."""
+        now = time.monotonic()
+        if self.last_connection_ok is not None and now - self.last_connection_ok < self.connection_check_ttl:
+            return True
         try:
             with self.engine.connect() as connection:
-                connection.execute("SELECT 1")
+                connection.execute(text("SELECT 1")).scalar()
+            self.last_connection_ok = now
             return True
         except Exception as e:
             logger.error(f"Database connection check failed: {str(e)}")
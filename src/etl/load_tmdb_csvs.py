@@ -1,12 +1,21 @@
+import os
+import queue
 import logging
+import tempfile
+import threading
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any
-from sqlalchemy import text
+from typing import Optional, Dict, Any, List, Iterator, Callable, Tuple
+from sqlalchemy import text, inspect
 from tqdm import tqdm
-import gc
 import sys
-import numpy as np
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    import pyarrow.compute as pc
+except ImportError:  # Optional; pandas' C parser is used without it
+    pa = None
 
 from src.database.db_manager import DatabaseManager
 
@@ -17,13 +26,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Values read as missing, on top of each parser's defaults
+NA_VALUES = ['', 'NA', 'NULL', 'null', 'None', 'none', 'nan', 'NaN']
+
+# Small integer columns outside movies.csv, narrowed to the smallest nullable type that fits
+SMALL_INT_COLUMNS = {
+    'credit_order': 'Int16',
+    'gender': 'Int8',
+}
+
+# Column order for LOAD DATA; matches the INSERT statements below
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    'movies': ['id', 'title', 'original_title', 'overview', 'release_date', 'runtime',
+               'status', 'vote_average', 'vote_count', 'popularity', 'poster_path',
+               'backdrop_path', 'budget', 'revenue'],
+    'credits': ['movie_id', 'person_id', 'credit_type', 'character_name',
+                'credit_order', 'department', 'job'],
+    'people': ['id', 'name', 'profile_path', 'gender', 'known_for_department'],
+    'genres': ['movie_id', 'genre_name'],
+}
+
+# Numeric/date columns whose empty CSV fields must load as NULL rather than 0 or a zero date
+NULLABLE_COLUMNS: Dict[str, List[str]] = {
+    'movies': ['release_date', 'runtime', 'vote_average', 'vote_count', 'popularity', 'budget', 'revenue'],
+    'credits': ['credit_order'],
+    'people': ['gender'],
+    'genres': [],
+}
+
 class TMDBDataLoader:
     def __init__(self, csv_dir: Path, db_config: Dict[str, Any], initial_load: bool = False):
         """Initialize the TMDB data loader."""
         self.csv_dir = csv_dir
         self.db_config = db_config
         self.initial_load = initial_load
-        self.chunk_size = 1000  # Adjust based on available memory
+        self.chunk_size = 10000  # Rows per parsed chunk; each chunk is inserted as soon as it is cleaned
+        self.arrow_block_size = 16 << 20  # Bytes per PyArrow CSV block, parsed in parallel
+        self.insert_queue_size = 4  # Parsed chunks allowed to wait for the insert thread
+        self.insert_batch_size = 10000  # Rows per executemany; the driver splits statements under max_allowed_packet
+        self.use_load_data = os.getenv('SQL_LOCAL_INFILE') == '1'  # Bulk load with LOAD DATA LOCAL INFILE, falls back to INSERT
+        self.dropped_indexes: Dict[str, List[Tuple[str, List[str]]]] = {}  # Rebuilt after an initial load
         self.conn = None
         self.cursor = None
         self._init_db_connection()
@@ -37,6 +79,17 @@ class TMDBDataLoader:
         self.conn = self.db.engine.connect()
         self.cursor = self.conn.connection.cursor()
 
+    def close(self):
+        """Release the database cursor and connection."""
+        self.cursor.close()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _clear_tables(self):
         """Clear specific tables in the database."""
         try:
@@ -61,12 +114,109 @@ class TMDBDataLoader:
             logger.error(f"Error clearing tables: {str(e)}")
             raise
 
-    def _load_csv_in_chunks(self, file_path: Path) -> pd.DataFrame:
-        """Load a CSV file in chunks to manage memory."""
+    def _drop_secondary_indexes(self, tables: List[str]):
+        """Drop plain secondary indexes ahead of a bulk load; _rebuild_secondary_indexes restores them."""
+        inspector = inspect(self.db.engine)
+        quote = self.db.engine.dialect.identifier_preparer.quote
+        for table in tables:
+            # Foreign keys need their index, and unique indexes are what INSERT IGNORE dedupes on
+            fk_columns = [fk['constrained_columns'] for fk in inspector.get_foreign_keys(table)]
+            for index in inspector.get_indexes(table):
+                columns = index['column_names']
+                if index['unique'] or index.get('dialect_options') or None in columns:
+                    continue  # Also keep FULLTEXT, prefix-length and functional indexes as they are
+                if any(columns[:len(fk)] == fk for fk in fk_columns):
+                    continue
+                logger.info(f"Dropping index {index['name']} on {table} for the bulk load")
+                self.cursor.execute(f"ALTER TABLE {quote(table)} DROP INDEX {quote(index['name'])}")
+                self.dropped_indexes.setdefault(table, []).append((index['name'], columns))
+
+    def _rebuild_secondary_indexes(self):
+        """Recreate the indexes dropped for the bulk load, one ALTER TABLE (and table scan) per table."""
+        quote = self.db.engine.dialect.identifier_preparer.quote
+        for table, indexes in self.dropped_indexes.items():
+            clauses = ', '.join(
+                f"ADD INDEX {quote(name)} ({', '.join(quote(col) for col in columns)})"
+                for name, columns in indexes
+            )
+            logger.info(f"Rebuilding {len(indexes)} index(es) on {table}")
+            self.cursor.execute(f"ALTER TABLE {quote(table)} {clauses}")
+        self.dropped_indexes = {}
+
+    def _arrow_to_frame(self, table, null_values: List[str]) -> pd.DataFrame:
+        """Convert a PyArrow table to a DataFrame, trimming leading whitespace like skipinitialspace."""
+        columns = []
+        for column in table.columns:
+            if pa.types.is_string(column.type):
+                column = pc.utf8_ltrim_whitespace(column)
+                # A value that only matches an NA token once trimmed is missing in the pandas path too
+                column = pc.if_else(pc.is_in(column, value_set=pa.array(null_values)), pa.scalar(None, pa.string()), column)
+            columns.append(column)
+        return pa.Table.from_arrays(columns, names=table.column_names).to_pandas()
+
+    def _iter_csv_chunks(self, file_path: Path, dtype_dict: Dict[str, Any]):
+        """Yield a CSV file as DataFrame chunks, all columns read as strings.
+        
+        Uses PyArrow's multi-threaded reader over a memory map when installed,
+        otherwise pandas' C parser.
+        """
+        if pa is not None:
+            null_values = NA_VALUES + pa_csv.ConvertOptions().null_values  # Same NA handling as pandas
+            with pa.memory_map(str(file_path), 'r') as source:
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(block_size=self.arrow_block_size, use_threads=True),
+                    parse_options=pa_csv.ParseOptions(
+                        quote_char='"',
+                        escape_char='\\',
+                        newlines_in_values=True,
+                        invalid_row_handler=lambda row: 'skip'  # Skip bad lines instead of failing
+                    ),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={col: pa.string() for col in dtype_dict},
+                        null_values=null_values,
+                        strings_can_be_null=True
+                    )
+                )
+                # Blocks are sized in bytes, so regroup their rows into chunk_size chunks like the pandas path
+                pending, pending_rows = [], 0
+                for batch in reader:
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    if pending_rows < self.chunk_size:
+                        continue
+                    table = pa.Table.from_batches(pending)
+                    full_rows = pending_rows - pending_rows % self.chunk_size
+                    for offset in range(0, full_rows, self.chunk_size):
+                        yield self._arrow_to_frame(table.slice(offset, self.chunk_size), null_values)
+                    pending = table.slice(full_rows).to_batches()
+                    pending_rows -= full_rows
+                if pending_rows:
+                    yield self._arrow_to_frame(pa.Table.from_batches(pending), null_values)
+            return
+        
+        # Read CSV in chunks with the C parser; its quoting/escape options match how tmdb_etl writes the files
+        yield from pd.read_csv(
+            file_path,
+            chunksize=self.chunk_size,
+            quoting=1,  # QUOTE_ALL - quote all fields
+            quotechar='"',
+            escapechar='\\',
+            on_bad_lines='skip',  # Skip bad lines instead of failing
+            engine='c',  # Much faster than the Python engine; bad lines are still skipped above
+            encoding='utf-8',
+            dtype=dtype_dict,
+            skipinitialspace=True,  # Skip spaces after delimiter
+            skip_blank_lines=True,  # Skip blank lines
+            na_values=NA_VALUES,  # Handle various NA values
+            keep_default_na=True,  # Keep pandas default NA values
+            na_filter=True,  # Enable NA filtering
+            sep=','  # Explicitly set separator
+        )
+
+    def _load_csv_in_chunks(self, file_path: Path) -> Iterator[pd.DataFrame]:
+        """Yield cleaned chunks of a CSV file, so only one chunk is held in memory at a time."""
         try:
-            # Get total number of rows for progress bar
-            total_rows = sum(1 for _ in open(file_path)) - 1  # Subtract header
-            
             # Define column types based on the file
             if file_path.name == 'movies.csv':
                 dtype_dict = {
@@ -111,55 +261,29 @@ class TMDBDataLoader:
             else:
                 raise ValueError(f"Unknown file type: {file_path.name}")
             
-            # Read CSV in chunks with more lenient parsing options
-            chunks = pd.read_csv(
-                file_path,
-                chunksize=self.chunk_size,
-                quoting=1,  # QUOTE_ALL - quote all fields
-                quotechar='"',
-                escapechar='\\',
-                on_bad_lines='skip',  # Skip bad lines instead of failing
-                engine='python',  # Use Python engine for better handling of malformed data
-                encoding='utf-8',
-                dtype=dtype_dict,
-                skipinitialspace=True,  # Skip spaces after delimiter
-                skip_blank_lines=True,  # Skip blank lines
-                na_values=['', 'NA', 'NULL', 'null', 'None', 'none', 'nan', 'NaN'],  # Handle various NA values
-                keep_default_na=True,  # Keep pandas default NA values
-                na_filter=True,  # Enable NA filtering
-                sep=','  # Explicitly set separator
-            )
-            
             # Process chunks with progress bar
-            processed_chunks = []
-            for chunk in tqdm(chunks, total=total_rows//self.chunk_size + 1, desc=f"Loading {file_path.name}"):
+            chunks = self._iter_csv_chunks(file_path, dtype_dict)
+            processed_count = 0
+            for chunk in tqdm(chunks, desc=f"Loading {file_path.name}", unit='chunk'):  # No total: counting rows would cost a full extra read
                 try:
                     # Clean the data
                     chunk = chunk.replace({pd.NA: None})  # Replace NA with None for SQL compatibility
                     
-                    # Handle empty fields based on column type
-                    for col in chunk.columns:
-                        if col in dtype_dict:
-                            if dtype_dict[col] == str:
-                                # For string columns, replace NaN/None with empty string
-                                chunk[col] = chunk[col].fillna('')
-                                # Clean string values
-                                chunk[col] = chunk[col].str.strip()  # Remove leading/trailing whitespace
-                                # Replace newlines with spaces in text fields
-                                if col in ['overview', 'title', 'original_title', 'name']:
-                                    chunk[col] = chunk[col].str.replace('\n', ' ').str.replace('\r', ' ')
-                                    # Handle any remaining unescaped commas in text fields
-                                    if col == 'overview':
-                                        chunk[col] = chunk[col].str.replace(',', ' ')
-                            else:
-                                # For non-string columns, keep NaN values
-                                chunk[col] = chunk[col].fillna(pd.NA)
+                    # For string columns, replace NaN/None with empty string in one pass over the frame
+                    string_columns = [col for col in chunk.columns if dtype_dict.get(col) == str]
+                    chunk[string_columns] = chunk[string_columns].fillna('')
+                    for col in string_columns:
+                        # Replace newlines (and unescaped commas in overview) with spaces in a single regex pass
+                        if col in ['overview', 'title', 'original_title', 'name']:
+                            pattern = r'[\r\n,]' if col == 'overview' else r'[\r\n]'
+                            chunk[col] = chunk[col].str.replace(pattern, ' ', regex=True)
+                        chunk[col] = chunk[col].str.strip()  # Remove leading/trailing whitespace
                     
                     # Convert numeric columns safely
                     if file_path.name == 'movies.csv':
                         numeric_columns = {
                             'id': 'Int64',
-                            'runtime': 'Int64',
+                            'runtime': 'Int32',  # Minutes; 32 bits is plenty
                             'vote_average': float,
                             'vote_count': 'Int64',
                             'popularity': float,
@@ -170,9 +294,9 @@ class TMDBDataLoader:
                             try:
                                 # First convert to float to handle any decimal points
                                 temp_col = pd.to_numeric(chunk[col].str.strip('"'), errors='coerce')
-                                if dtype == 'Int64':
+                                if dtype in ('Int64', 'Int32'):
                                     # For integer columns, round to nearest integer and convert
-                                    chunk[col] = temp_col.round().astype('Int64')
+                                    chunk[col] = temp_col.round().astype(dtype)
                                 else:
                                     # For float columns, keep as is
                                     chunk[col] = temp_col.astype(dtype)
@@ -190,25 +314,63 @@ class TMDBDataLoader:
                             errors='coerce'  # Convert invalid dates to NaT
                         )
                     
-                    processed_chunks.append(chunk)
+                    # Downcast small integer columns to cut memory
+                    for col, dtype in SMALL_INT_COLUMNS.items():
+                        if col in chunk.columns:
+                            try:
+                                chunk[col] = pd.to_numeric(chunk[col], errors='coerce').round().astype(dtype)
+                            except Exception as e:
+                                logger.warning(f"Error converting column {col} to {dtype}: {str(e)}")
                     
                 except Exception as e:
                     logger.warning(f"Error processing chunk: {str(e)}")
                     continue
                 
-                # Clear memory after each chunk
-                gc.collect()
+                # Hand the chunk straight to the caller instead of accumulating the whole file
+                processed_count += 1
+                yield chunk
             
-            if not processed_chunks:
+            if not processed_count:
                 raise ValueError(f"No valid data could be processed from {file_path}")
             
-            # Combine all chunks
-            return pd.concat(processed_chunks, ignore_index=True)
-            
         except Exception as e:
             logger.error(f"Error loading CSV file {file_path}: {str(e)}")
             raise
 
+    def _load_data_infile(self, table: str, df: pd.DataFrame) -> bool:
+        """Bulk load DataFrame rows with LOAD DATA LOCAL INFILE.
+        
+        Returns False (and disables LOAD DATA for the rest of the run) if the server
+        or driver refuses it, so the caller can fall back to INSERT.
+        """
+        columns = TABLE_COLUMNS[table]
+        nullable_columns = NULLABLE_COLUMNS[table]
+        
+        # Read nullable columns into user variables so empty fields can be turned into NULL
+        targets = ', '.join(f"@{col}" if col in nullable_columns else col for col in columns)
+        assignments = ', '.join(f"{col} = NULLIF(@{col}, '')" for col in nullable_columns)
+        load_stmt = text(f"""
+            LOAD DATA LOCAL INFILE :path IGNORE INTO TABLE {table}
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+            LINES TERMINATED BY '\\n'
+            ({targets})
+            {'SET ' + assignments if assignments else ''}
+        """)
+        
+        fd, tmp_path = tempfile.mkstemp(suffix='.csv')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                df[columns].to_csv(f, index=False, header=False, na_rep='', lineterminator='\n', date_format='%Y-%m-%d')
+            self.conn.execute(load_stmt, {'path': tmp_path})
+            return True
+        except Exception as e:
+            logger.warning(f"LOAD DATA into {table} failed, falling back to INSERT: {str(e)}")
+            self.use_load_data = False
+            return False
+        finally:
+            os.remove(tmp_path)
+
     def _insert_movies(self, df: pd.DataFrame):
         """Insert movies into the database."""
         try:
@@ -225,41 +387,36 @@ class TMDBDataLoader:
                 )
             """)
             
+            # Ensure movie IDs are valid, once for the whole chunk rather than per batch
+            df['id'] = pd.to_numeric(df['id'], errors='coerce')
+            df = df.dropna(subset=['id']).astype({'id': int})  # Remove rows with invalid IDs, convert to integer
+            
+            # Remove duplicate IDs within the chunk
+            df = df.drop_duplicates(subset=['id'])
+            
             # Process in batches
-            for i in tqdm(range(0, len(df), 1000), desc="Inserting movies"):
-                batch = df.iloc[i:i + 1000].copy()
-                
-                # Replace NaN values with None for MySQL compatibility
-                numeric_columns = ['runtime', 'vote_average', 'vote_count', 'popularity', 'budget', 'revenue']
-                for col in numeric_columns:
-                    batch[col] = batch[col].replace({np.nan: None})
+            for i in range(0, len(df), self.insert_batch_size):
+                batch = df.iloc[i:i + self.insert_batch_size]
                 
-                # Ensure movie IDs are valid
-                batch['id'] = pd.to_numeric(batch['id'], errors='coerce')
-                batch = batch.dropna(subset=['id'])  # Remove rows with invalid IDs
-                batch['id'] = batch['id'].astype(int)  # Convert to integer
-                
-                # Remove duplicate IDs within the batch
-                batch = batch.drop_duplicates(subset=['id'])
+                # Prefer LOAD DATA; if the server refuses it, fall through to executemany
+                if self.use_load_data and self._load_data_infile('movies', batch):
+                    continue
                 
-                # Convert to records and replace any remaining NaN values
-                records = batch.to_dict('records')
-                for record in records:
-                    for key, value in record.items():
-                        if pd.isna(value):
-                            record[key] = None
+                # Convert to records with NaN/NA/NaT mapped to None in one vectorized mask
+                records = batch.astype(object).where(batch.notna(), None).to_dict('records')
                 
                 if records:  # Only execute if we have valid records
                     try:
-                        # Log the first few records being inserted for debugging
-                        logger.debug(f"Inserting batch starting with movie IDs: {[r['id'] for r in records[:5]]}")
+                        # Log the first few records being inserted for debugging (skip formatting unless enabled)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Inserting batch starting with movie IDs: {[r['id'] for r in records[:5]]}")
                         
                         # Execute the insert
                         result = self.conn.execute(insert_stmt, records)
-                        self.conn.commit()
                         
                         # Log the number of rows affected
-                        logger.debug(f"Successfully inserted {result.rowcount} movies in this batch")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Successfully inserted {result.rowcount} movies in this batch")
                         
                     except Exception as e:
                         # Log the specific movie IDs that caused the error
@@ -287,36 +444,29 @@ class TMDBDataLoader:
                 )
             """)
             
+            # Ensure IDs are valid, once for the whole chunk rather than per batch
+            df['movie_id'] = pd.to_numeric(df['movie_id'], errors='coerce')
+            df['person_id'] = pd.to_numeric(df['person_id'], errors='coerce')
+            df = df.dropna(subset=['movie_id', 'person_id'])  # Remove rows with invalid IDs
+            df = df.astype({'movie_id': int, 'person_id': int})
+            
+            # Remove duplicate combinations of movie_id and person_id
+            df = df.drop_duplicates(subset=['movie_id', 'person_id', 'credit_type'])
+            
             # Process in batches
-            for i in tqdm(range(0, len(df), 1000), desc="Inserting credits"):
-                batch = df.iloc[i:i + 1000].copy()
-                
-                # Replace NaN values with None for MySQL compatibility
-                numeric_columns = ['credit_order']
-                for col in numeric_columns:
-                    batch[col] = batch[col].replace({np.nan: None})
-                
-                # Ensure IDs are valid
-                batch['movie_id'] = pd.to_numeric(batch['movie_id'], errors='coerce')
-                batch['person_id'] = pd.to_numeric(batch['person_id'], errors='coerce')
-                batch = batch.dropna(subset=['movie_id', 'person_id'])  # Remove rows with invalid IDs
-                batch['movie_id'] = batch['movie_id'].astype(int)
-                batch['person_id'] = batch['person_id'].astype(int)
+            for i in range(0, len(df), self.insert_batch_size):
+                batch = df.iloc[i:i + self.insert_batch_size]
                 
-                # Remove duplicate combinations of movie_id and person_id
-                batch = batch.drop_duplicates(subset=['movie_id', 'person_id', 'credit_type'])
+                # Prefer LOAD DATA; if the server refuses it, fall through to executemany
+                if self.use_load_data and self._load_data_infile('credits', batch):
+                    continue
                 
-                # Convert to records and replace any remaining NaN values
-                records = batch.to_dict('records')
-                for record in records:
-                    for key, value in record.items():
-                        if pd.isna(value):
-                            record[key] = None
+                # Convert to records with NaN/NA/NaT mapped to None in one vectorized mask
+                records = batch.astype(object).where(batch.notna(), None).to_dict('records')
                 
                 if records:  # Only execute if we have valid records
                     try:
                         self.conn.execute(insert_stmt, records)
-                        self.conn.commit()
                     except Exception as e:
                         logger.error(f"Error inserting batch of credits: {str(e)}")
                         continue
@@ -337,34 +487,27 @@ class TMDBDataLoader:
                 )
             """)
             
+            # Ensure IDs are valid, once for the whole chunk rather than per batch
+            df['id'] = pd.to_numeric(df['id'], errors='coerce')
+            df = df.dropna(subset=['id']).astype({'id': int})  # Remove rows with invalid IDs
+            
+            # Remove duplicate IDs within the chunk
+            df = df.drop_duplicates(subset=['id'])
+            
             # Process in batches
-            for i in tqdm(range(0, len(df), 1000), desc="Inserting people"):
-                batch = df.iloc[i:i + 1000].copy()
-                
-                # Replace NaN values with None for MySQL compatibility
-                numeric_columns = ['gender']
-                for col in numeric_columns:
-                    batch[col] = batch[col].replace({np.nan: None})
+            for i in range(0, len(df), self.insert_batch_size):
+                batch = df.iloc[i:i + self.insert_batch_size]
                 
-                # Ensure IDs are valid
-                batch['id'] = pd.to_numeric(batch['id'], errors='coerce')
-                batch = batch.dropna(subset=['id'])  # Remove rows with invalid IDs
-                batch['id'] = batch['id'].astype(int)
-                
-                # Remove duplicate IDs within the batch
-                batch = batch.drop_duplicates(subset=['id'])
+                # Prefer LOAD DATA; if the server refuses it, fall through to executemany
+                if self.use_load_data and self._load_data_infile('people', batch):
+                    continue
                 
-                # Convert to records and replace any remaining NaN values
-                records = batch.to_dict('records')
-                for record in records:
-                    for key, value in record.items():
-                        if pd.isna(value):
-                            record[key] = None
+                # Convert to records with NaN/NA/NaT mapped to None in one vectorized mask
+                records = batch.astype(object).where(batch.notna(), None).to_dict('records')
                 
                 if records:  # Only execute if we have valid records
                     try:
                         self.conn.execute(insert_stmt, records)
-                        self.conn.commit()
                     except Exception as e:
                         logger.error(f"Error inserting batch of people: {str(e)}")
                         continue
@@ -385,29 +528,27 @@ class TMDBDataLoader:
                 )
             """)
             
+            # Ensure movie IDs are valid, once for the whole chunk rather than per batch
+            df['movie_id'] = pd.to_numeric(df['movie_id'], errors='coerce')
+            df = df.dropna(subset=['movie_id']).astype({'movie_id': int})  # Remove rows with invalid IDs
+            
+            # Remove duplicate combinations of movie_id and genre_name
+            df = df.drop_duplicates(subset=['movie_id', 'genre_name'])
+            
             # Process in batches
-            for i in tqdm(range(0, len(df), 1000), desc="Inserting genres"):
-                batch = df.iloc[i:i + 1000].copy()
+            for i in range(0, len(df), self.insert_batch_size):
+                batch = df.iloc[i:i + self.insert_batch_size]
                 
-                # Ensure movie IDs are valid
-                batch['movie_id'] = pd.to_numeric(batch['movie_id'], errors='coerce')
-                batch = batch.dropna(subset=['movie_id'])  # Remove rows with invalid IDs
-                batch['movie_id'] = batch['movie_id'].astype(int)
-                
-                # Remove duplicate combinations of movie_id and genre_name
-                batch = batch.drop_duplicates(subset=['movie_id', 'genre_name'])
+                # Prefer LOAD DATA; if the server refuses it, fall through to executemany
+                if self.use_load_data and self._load_data_infile('genres', batch):
+                    continue
                 
-                # Convert to records and replace any remaining NaN values
-                records = batch.to_dict('records')
-                for record in records:
-                    for key, value in record.items():
-                        if pd.isna(value):
-                            record[key] = None
+                # Convert to records with NaN/NA/NaT mapped to None in one vectorized mask
+                records = batch.astype(object).where(batch.notna(), None).to_dict('records')
                 
                 if records:  # Only execute if we have valid records
                     try:
                         self.conn.execute(insert_stmt, records)
-                        self.conn.commit()
                     except Exception as e:
                         logger.error(f"Error inserting batch of genres: {str(e)}")
                         continue
@@ -416,34 +557,63 @@ class TMDBDataLoader:
             logger.error(f"Error in genres insertion process: {str(e)}")
             raise
 
+    def _load_file(self, file_name: str, insert: Callable[[pd.DataFrame], None]):
+        """Parse a CSV file on this thread while a background thread inserts its chunks.
+        
+        The whole file is written in one transaction, committed once at the end.
+        """
+        chunk_queue = queue.Queue(maxsize=self.insert_queue_size)  # Bounds memory if inserts fall behind
+        errors = []
+        
+        def insert_worker():
+            while True:
+                chunk = chunk_queue.get()
+                if chunk is None:  # Sentinel: parsing finished
+                    return
+                if errors:
+                    continue  # Keep draining so the parser never blocks on a full queue
+                try:
+                    insert(chunk)
+                except Exception as e:
+                    errors.append(e)
+        
+        worker = threading.Thread(target=insert_worker, name=f"insert-{file_name}", daemon=True)
+        worker.start()
+        try:
+            for chunk in self._load_csv_in_chunks(self.csv_dir / file_name):
+                if errors:
+                    break
+                chunk_queue.put(chunk)
+        finally:
+            chunk_queue.put(None)
+            worker.join()
+            # Keep whatever was written, as the per-batch commits used to
+            self.conn.commit()
+        
+        if errors:
+            raise errors[0]
+
     def run(self) -> None:
         """Run the data loading process."""
         try:
             logger.info("Starting TMDB data loading process...")
             
-            # Load and insert movies
-            movies_df = self._load_csv_in_chunks(self.csv_dir / 'movies.csv')
-            self._insert_movies(movies_df)
-            del movies_df
-            gc.collect()
-            
-            # Load and insert people
-            people_df = self._load_csv_in_chunks(self.csv_dir / 'people.csv')
-            self._insert_people(people_df)
-            del people_df
-            gc.collect()
-            
-            # Load and insert credits
-            credits_df = self._load_csv_in_chunks(self.csv_dir / 'credits.csv')
-            self._insert_credits(credits_df)
-            del credits_df
-            gc.collect()
-            
-            # Load and insert genres
-            genres_df = self._load_csv_in_chunks(self.csv_dir / 'genres.csv')
-            self._insert_genres(genres_df)
-            del genres_df
-            gc.collect()
+            # Rows are loaded parents first, so skip per-row foreign key lookups for the bulk load
+            self.cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 0")
+            try:
+                # On an initial load, building indexes once afterwards is cheaper than maintaining them row by row
+                if self.initial_load:
+                    self._drop_secondary_indexes(list(TABLE_COLUMNS))
+                
+                # Stream each file into its table, parsing the next chunk while the previous one is inserted
+                self._load_file('movies.csv', self._insert_movies)
+                self._load_file('people.csv', self._insert_people)
+                self._load_file('credits.csv', self._insert_credits)
+                self._load_file('genres.csv', self._insert_genres)
+            finally:
+                self.cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 1")
+                # Restore dropped indexes even if a file (or the drop itself) failed part way
+                self._rebuild_secondary_indexes()
             
             logger.info("Data loading process completed successfully")
             
@@ -463,8 +633,8 @@ def main():
         sys.exit(1)
 
     logger.info("Starting initial TMDB data load from CSV files...")
-    loader = TMDBDataLoader(Path('data/csv'), {}, True)
-    loader.run()
+    with TMDBDataLoader(Path('data/csv'), {}, True) as loader:
+        loader.run()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -7,11 +7,10 @@ import pandas as pd
 from tqdm import tqdm
 from fuzzywuzzy import process
 import sys
-import time
 
 from src.api.tmdb_client import TMDBClient
 from src.database.db_manager import DatabaseManager
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
 
 # Configure logging
 logging.basicConfig(
@@ -21,11 +20,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class TMDBUpdater:
-    def __init__(self):
-        """Initialize TMDB updater."""
-        self.client = TMDBClient()
+    def __init__(self, client: Optional[TMDBClient] = None):
+        """Initialize TMDB updater, optionally reusing an existing TMDB client."""
+        self.owns_client = client is None
+        self.client = client or TMDBClient()
         self.db = DatabaseManager()
         self.conn = self.db.engine.connect()
+        self.changes_window_days = 14  # TMDB's movie/changes feed covers at most 14 days
+
+    def close(self):
+        """Release the database connection, and the TMDB client if this updater created it."""
+        self.conn.close()
+        if self.owns_client:
+            self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def update_existing_movie(self, movie_id: int) -> bool:
         """Update an existing movie's information in the database."""
@@ -67,22 +80,7 @@ class TMDBUpdater:
             """)
 
             # Prepare movie data
-            movie_record = {
-                'id': movie_data['id'],
-                'title': movie_data['title'],
-                'original_title': movie_data['original_title'],
-                'overview': movie_data['overview'],
-                'release_date': movie_data['release_date'],
-                'runtime': movie_data['runtime'],
-                'status': movie_data['status'],
-                'vote_average': movie_data['vote_average'],
-                'vote_count': movie_data['vote_count'],
-                'popularity': movie_data['popularity'],
-                'poster_path': movie_data['poster_path'],
-                'backdrop_path': movie_data['backdrop_path'],
-                'budget': movie_data['budget'],
-                'revenue': movie_data['revenue']
-            }
+            movie_record = self._build_movie_record(movie_data)
 
             # Execute update
             self.conn.execute(update_stmt, movie_record)
@@ -98,55 +96,161 @@ class TMDBUpdater:
             return True
 
         except Exception as e:
+            self.conn.rollback()
             logger.error(f"Error updating movie {movie_id}: {str(e)}")
             return False
 
+    def _build_movie_record(self, movie_data: Dict) -> Dict:
+        """Map TMDB movie details onto the movies table columns."""
+        return {
+            'id': movie_data['id'],
+            'title': movie_data['title'],
+            'original_title': movie_data['original_title'],
+            'overview': movie_data['overview'],
+            'release_date': movie_data['release_date'],
+            'runtime': movie_data['runtime'],
+            'status': movie_data['status'],
+            'vote_average': movie_data['vote_average'],
+            'vote_count': movie_data['vote_count'],
+            'popularity': movie_data['popularity'],
+            'poster_path': movie_data['poster_path'],
+            'backdrop_path': movie_data['backdrop_path'],
+            'budget': movie_data['budget'],
+            'revenue': movie_data['revenue']
+        }
+
+    def _build_credit_records(self, movie_id: int, credits_data: Dict) -> List[Dict]:
+        """Build credits rows for the top 8 actors and the first director."""
+        credits_records = []
+
+        # Process cast (actors)
+        for person in credits_data.get('cast', [])[:8]:  # Top 8 actors
+            if person.get('id'):
+                credits_records.append({
+                    'movie_id': movie_id,
+                    'person_id': person['id'],
+                    'credit_type': 'cast',
+                    'character_name': person.get('character'),
+                    'credit_order': person.get('order'),
+                    'department': 'Acting',
+                    'job': 'Actor'
+                })
+
+        # Process crew (directors only)
+        directors = [person for person in credits_data.get('crew', [])
+                    if person.get('job') == 'Director'][:1]  # Only get the first director
+        for director in directors:
+            if director.get('id'):
+                credits_records.append({
+                    'movie_id': movie_id,
+                    'person_id': director['id'],
+                    'credit_type': 'crew',
+                    'character_name': None,
+                    'credit_order': None,
+                    'department': director.get('department', 'Directing'),
+                    'job': director.get('job')
+                })
+
+        return credits_records
+
+    def _upsert_movies_batch(self, batch: List[Tuple[Dict, Optional[Dict]]]) -> int:
+        """Write a batch of (movie_data, credits_data) pairs with one statement per table.
+        
+        credits_data may be None, in which case the movie is written without credits.
+        """
+        movie_records = [self._build_movie_record(movie_data) for movie_data, _ in batch]
+        movie_ids = [record['id'] for record in movie_records]
+        genre_records = [
+            {'movie_id': movie_data['id'], 'genre_name': genre['name']}
+            for movie_data, _ in batch
+            for genre in movie_data.get('genres', [])
+        ]
+        credits_records = [
+            record
+            for movie_data, credits_data in batch
+            for record in self._build_credit_records(movie_data['id'], credits_data or {})
+        ]
+
+        try:
+            # Upsert movie rows in a single multi-row statement
+            upsert_stmt = text("""
+                INSERT INTO movies (
+                    id, title, original_title, overview, release_date, runtime,
+                    status, vote_average, vote_count, popularity, poster_path,
+                    backdrop_path, budget, revenue
+                ) VALUES (
+                    :id, :title, :original_title, :overview, :release_date, :runtime,
+                    :status, :vote_average, :vote_count, :popularity, :poster_path,
+                    :backdrop_path, :budget, :revenue
+                )
+                ON DUPLICATE KEY UPDATE
+                    title = VALUES(title),
+                    original_title = VALUES(original_title),
+                    overview = VALUES(overview),
+                    release_date = VALUES(release_date),
+                    runtime = VALUES(runtime),
+                    status = VALUES(status),
+                    vote_average = VALUES(vote_average),
+                    vote_count = VALUES(vote_count),
+                    popularity = VALUES(popularity),
+                    poster_path = VALUES(poster_path),
+                    backdrop_path = VALUES(backdrop_path),
+                    budget = VALUES(budget),
+                    revenue = VALUES(revenue),
+                    updated_at = CURRENT_TIMESTAMP
+            """)
+            self.conn.execute(upsert_stmt, movie_records)
+
+            # Replace genres and credits for the whole batch
+            ids_param = {'movie_ids': movie_ids}
+            self.conn.execute(
+                text("DELETE FROM genres WHERE movie_id IN :movie_ids")
+                .bindparams(bindparam('movie_ids', expanding=True)),
+                ids_param
+            )
+            if genre_records:
+                self.conn.execute(text("""
+                    INSERT INTO genres (movie_id, genre_name)
+                    VALUES (:movie_id, :genre_name)
+                """), genre_records)
+
+            self.conn.execute(
+                text("DELETE FROM credits WHERE movie_id IN :movie_ids")
+                .bindparams(bindparam('movie_ids', expanding=True)),
+                ids_param
+            )
+            if credits_records:
+                self.conn.execute(text("""
+                    INSERT INTO credits (
+                        movie_id, person_id, credit_type, character_name,
+                        credit_order, department, job
+                    ) VALUES (
+                        :movie_id, :person_id, :credit_type, :character_name,
+                        :credit_order, :department, :job
+                    )
+                """), credits_records)
+
+            self.conn.commit()
+            logger.info(f"Wrote {len(movie_records)} movies, {len(genre_records)} genres "
+                      f"and {len(credits_records)} credits")
+            return len(movie_records)
+
+        except Exception:
+            self.conn.rollback()
+            raise
+
     def _update_credits(self, movie_id: int, credits_data: Dict):
-        """Update credits for a movie."""
+        """Update credits for a movie; the caller commits."""
         try:
             # Delete existing credits
             delete_stmt = text("DELETE FROM credits WHERE movie_id = :movie_id")
             self.conn.execute(delete_stmt, {'movie_id': movie_id})
 
             # Prepare credits records
-            credits_records = []
-
-            # Process cast (actors)
-            actors = credits_data.get('cast', [])[:8]  # Top 8 actors
-            if actors:
-                logger.info(f"Processing {len(actors)} actors for movie {movie_id}")
-                for person in actors:
-                    if person.get('id'):
-                        credits_records.append({
-                            'movie_id': movie_id,
-                            'person_id': person['id'],
-                            'credit_type': 'cast',
-                            'character_name': person.get('character'),
-                            'credit_order': person.get('order'),
-                            'department': 'Acting',
-                            'job': 'Actor'
-                        })
-                        logger.info(f"  - Actor: {person.get('name')} as {person.get('character', 'Unknown')}")
-            else:
+            credits_records = self._build_credit_records(movie_id, credits_data)
+            if not any(r['credit_type'] == 'cast' for r in credits_records):
                 logger.warning(f"No actors found for movie {movie_id}")
-
-            # Process crew (directors only)
-            directors = [person for person in credits_data.get('crew', [])
-                        if person.get('job') == 'Director'][:1]  # Only get the first director
-            if directors:
-                director = directors[0]
-                if director.get('id'):
-                    credits_records.append({
-                        'movie_id': movie_id,
-                        'person_id': director['id'],
-                        'credit_type': 'crew',
-                        'character_name': None,
-                        'credit_order': None,
-                        'department': director.get('department', 'Directing'),
-                        'job': director.get('job')
-                    })
-                    logger.info(f"  - Director: {director.get('name')}")
-            else:
+            if not any(r['credit_type'] == 'crew' for r in credits_records):
                 logger.warning(f"No director found for movie {movie_id}")
 
             if not credits_records:
@@ -165,7 +269,6 @@ class TMDBUpdater:
             """)
 
             self.conn.execute(insert_stmt, credits_records)
-            self.conn.commit()
 
             # Log summary
             actor_count = len([r for r in credits_records if r['credit_type'] == 'cast'])
@@ -177,7 +280,7 @@ class TMDBUpdater:
             raise
 
     def _update_genres(self, movie_id: int, movie_data: Dict):
-        """Update genres for a movie."""
+        """Update genres for a movie; the caller commits."""
         try:
             # Delete existing genres
             delete_stmt = text("DELETE FROM genres WHERE movie_id = :movie_id")
@@ -201,7 +304,6 @@ class TMDBUpdater:
             ]
 
             self.conn.execute(insert_stmt, genre_records)
-            self.conn.commit()
             
             # Log genre names
             genre_names = [genre['name'] for genre in genres]
@@ -224,7 +326,7 @@ class TMDBUpdater:
                     return False
                 
                 # Check if movie already exists in database
-                existing_ids = self._get_existing_movie_ids()
+                existing_ids = self._get_existing_movie_ids([movie_id])
                 if movie_id in existing_ids:
                     logger.info(f"Movie with ID {movie_id} already exists in database")
                     return False
@@ -239,7 +341,7 @@ class TMDBUpdater:
                 return False
 
             # Get existing movie IDs from database
-            existing_ids = self._get_existing_movie_ids()
+            existing_ids = self._get_existing_movie_ids([movie['id'] for movie in search_results])
 
             # Filter out existing movies
             new_results = [movie for movie in search_results if movie['id'] not in existing_ids]
@@ -287,20 +389,26 @@ class TMDBUpdater:
             logger.error(f"Error searching and adding movie: {str(e)}")
             return False
 
-    def _get_existing_movie_ids(self) -> List[int]:
-        """Get list of existing movie IDs from database."""
+    def _get_existing_movie_ids(self, movie_ids: List[int]) -> set:
+        """Get which of the given movie IDs already exist in the database."""
+        if not movie_ids:
+            return set()
         try:
-            result = self.conn.execute(text("SELECT id FROM movies"))
-            return [row[0] for row in result]
+            result = self.conn.execute(
+                text("SELECT id FROM movies WHERE id IN :movie_ids")
+                .bindparams(bindparam('movie_ids', expanding=True)),
+                {'movie_ids': list(movie_ids)}
+            )
+            return {row[0] for row in result}
         except Exception as e:
             logger.error(f"Error getting existing movie IDs: {str(e)}")
-            return []
+            return set()
 
     def _add_movie_to_db(self, movie_id: int) -> bool:
         """Add a new movie to the database."""
         try:
             # Check if movie already exists
-            existing_ids = self._get_existing_movie_ids()
+            existing_ids = self._get_existing_movie_ids([movie_id])
             if movie_id in existing_ids:
                 logger.info(f"Movie with ID {movie_id} already exists in database")
                 return False
@@ -329,22 +437,7 @@ class TMDBUpdater:
                 )
             """)
 
-            movie_record = {
-                'id': movie_data['id'],
-                'title': movie_data['title'],
-                'original_title': movie_data['original_title'],
-                'overview': movie_data['overview'],
-                'release_date': movie_data['release_date'],
-                'runtime': movie_data['runtime'],
-                'status': movie_data['status'],
-                'vote_average': movie_data['vote_average'],
-                'vote_count': movie_data['vote_count'],
-                'popularity': movie_data['popularity'],
-                'poster_path': movie_data['poster_path'],
-                'backdrop_path': movie_data['backdrop_path'],
-                'budget': movie_data['budget'],
-                'revenue': movie_data['revenue']
-            }
+            movie_record = self._build_movie_record(movie_data)
 
             self.conn.execute(insert_stmt, movie_record)
 
@@ -362,10 +455,11 @@ class TMDBUpdater:
             return True
 
         except Exception as e:
+            self.conn.rollback()
             logger.error(f"Error adding movie {movie_id}: {str(e)}")
             return False
 
-    def add_new_movies(self, time_period: str = None) -> int:
+    def add_new_movies(self, time_period: str = None, batch_size: int = 100) -> int:
         """Add new movies to the database based on release date."""
         try:
             # Get the latest movie date from database
@@ -407,25 +501,49 @@ class TMDBUpdater:
                 return 0
 
             # Get existing movie IDs
-            existing_ids = self._get_existing_movie_ids()
+            existing_ids = self._get_existing_movie_ids([movie['id'] for movie in new_movies])
 
             # Filter out existing movies
             movies_to_add = [movie for movie in new_movies if movie['id'] not in existing_ids]
-
-            # Add new movies
-            added_count = 0
-            for movie in tqdm(movies_to_add, desc="Adding new movies"):
-                # Get detailed movie info including genres
-                movie_details = self.client.get_movie_details(movie['id'])
+            if existing_ids:
+                logger.info(f"Skipping {len(new_movies) - len(movies_to_add)} movies already in database")
+
+            # Fetch details (with credits appended) for all new movies concurrently
+            details = self.client.get_movie_details_many([movie['id'] for movie in movies_to_add])
+
+            # Summarise per-movie outcomes once instead of logging inside the loop
+            log_each = logger.isEnabledFor(logging.DEBUG)
+            missing_ids = []
+            no_credits_count = 0
+            batch_data = []
+            for movie in movies_to_add:
+                movie_details = details.get(movie['id'])
                 if not movie_details:
+                    missing_ids.append(movie['id'])
                     continue
 
-                # Log genres for this movie
-                genres = [genre['name'] for genre in movie_details.get('genres', [])]
-                logger.info(f"Adding new movie {movie['id']} with genres: {', '.join(genres) if genres else 'No genres'}")
+                if log_each:
+                    genres = [genre['name'] for genre in movie_details.get('genres', [])]
+                    logger.debug(f"Adding new movie {movie['id']} with genres: {', '.join(genres) if genres else 'No genres'}")
 
-                if self._add_movie_to_db(movie['id']):
-                    added_count += 1
+                credits_data = movie_details.get('credits')
+                if not credits_data:
+                    no_credits_count += 1
+                batch_data.append((movie_details, credits_data))
+
+            if missing_ids:
+                logger.error(f"Could not find {len(missing_ids)} movies in TMDB: {missing_ids[:10]}")
+            if no_credits_count:
+                logger.warning(f"No credits found for {no_credits_count} movies - they will be added without credits")
+
+            # Write new movies in batches, one transaction per batch
+            added_count = 0
+            for start in tqdm(range(0, len(batch_data), batch_size), desc="Adding new movies"):
+                batch = batch_data[start:start + batch_size]
+                try:
+                    added_count += self._upsert_movies_batch(batch)
+                except Exception as e:
+                    logger.error(f"Error writing batch of {len(batch)} new movies: {str(e)}")
 
             logger.info(f"Added {added_count} new movies")
             return added_count
@@ -434,8 +552,12 @@ class TMDBUpdater:
             logger.error(f"Error adding new movies: {str(e)}")
             return 0
 
-    def update_all_movies(self, batch_size: int = 100) -> int:
-        """Update all movies in the database that have been updated in TMDB."""
+    def update_all_movies(self, batch_size: int = 100, full_refresh: bool = False) -> int:
+        """Update all movies in the database that have been updated in TMDB.
+        
+        Movies whose updated_at falls inside TMDB's change-feed window are skipped unless
+        the feed lists them as changed; older rows and full_refresh runs are always refetched.
+        """
         try:
             # Get total count of movies
             count_result = self.conn.execute(text("SELECT COUNT(*) FROM movies"))
@@ -447,6 +569,13 @@ class TMDBUpdater:
 
             updated_count = 0
             processed_count = 0
+            skipped_count = 0
+
+            # Movies refreshed within the change-feed window only need refetching if TMDB changed them
+            changes_since = datetime.now() - timedelta(days=self.changes_window_days)
+            changed_ids = None if full_refresh else self.client.get_changed_movie_ids(changes_since)
+            if changed_ids is not None:
+                logger.info(f"{len(changed_ids)} movies changed on TMDB since {changes_since:%Y-%m-%d}")
 
             # Process movies in batches
             while processed_count < total_movies:
@@ -470,36 +599,49 @@ class TMDBUpdater:
                           f"({processed_count + 1} to {processed_count + len(batch_movies)} "
                           f"of {total_movies})")
 
-                for movie_id, last_update in tqdm(batch_movies, desc="Checking for updates"):
-                    try:
-                        # Get movie details from TMDB
-                        movie_data = self.client.get_movie_details(movie_id)
-                        if not movie_data:
-                            logger.warning(f"Could not find movie {movie_id} in TMDB")
-                            continue
+                # Fetch details and credits for the whole batch concurrently,
+                # then write it in one transaction
+                batch_ids = [
+                    movie_id for movie_id, updated_at in batch_movies
+                    if changed_ids is None or updated_at is None
+                    or updated_at < changes_since or movie_id in changed_ids
+                ]
+                skipped_count += len(batch_movies) - len(batch_ids)
+                processed_count += len(batch_movies)
+                if not batch_ids:
+                    continue
+
+                try:
+                    details = self.client.get_movie_details_many(batch_ids)
+                    credits = self.client.get_movie_credits_many(batch_ids)
+                except Exception as e:
+                    logger.error(f"Error fetching batch from TMDB: {str(e)}")
+                    details, credits = {}, {}
+
+                batch_data = []
+                for movie_id in batch_ids:
+                    movie_data = details.get(movie_id)
+                    if not movie_data:
+                        logger.warning(f"Could not find movie {movie_id} in TMDB")
+                        continue
 
-                        # Log genres for this movie
-                        genres = [genre['name'] for genre in movie_data.get('genres', [])]
-                        logger.info(f"Updating movie {movie_id} with genres: {', '.join(genres) if genres else 'No genres'}")
+                    credits_data = credits.get(movie_id)
+                    if not credits_data:
+                        logger.warning(f"No credits found for movie {movie_id}")
+                        continue
 
-                        # Update movie regardless of last update time
-                        if self.update_existing_movie(movie_id):
-                            updated_count += 1
+                    # Update movie regardless of last update time
+                    batch_data.append((movie_data, credits_data))
 
+                if batch_data:
+                    try:
+                        updated_count += self._upsert_movies_batch(batch_data)
                     except Exception as e:
-                        logger.error(f"Error updating movie {movie_id}: {str(e)}")
-                        continue
+                        logger.error(f"Error writing batch of {len(batch_data)} movies: {str(e)}")
 
-                processed_count += len(batch_movies)
-                
                 # Log progress
                 logger.info(f"Processed {processed_count}/{total_movies} movies. "
-                          f"Updated {updated_count} movies so far.")
-
-                # Add a small delay between batches to avoid rate limits
-                if processed_count < total_movies:
-                    logger.info("Waiting 1 second before processing next batch...")
-                    time.sleep(1)
+                          f"Updated {updated_count} movies so far, skipped {skipped_count} unchanged.")
 
             logger.info(f"Completed processing all movies. Updated {updated_count} movies in total.")
             return updated_count
@@ -520,22 +662,23 @@ def main():
                        help='Time period for new movies (day/week/month or number of days)')
     parser.add_argument('--batch-size', type=int, default=100,
                        help='Number of movies to process in each batch (default: 100)')
+    parser.add_argument('--full-refresh', action='store_true',
+                       help='Refetch every movie instead of only those changed on TMDB')
     
     args = parser.parse_args()
     
-    updater = TMDBUpdater()
-    
-    if args.update is not None:
-        if args.update is True:  # No ID provided
-            updater.update_all_movies(batch_size=args.batch_size)
-        else:  # ID provided
-            updater.update_existing_movie(args.update)
-    elif args.search:
-        updater.search_and_add_movie(args.search)
-    elif args.add_new_movies:
-        updater.add_new_movies(args.time_period)
-    else:
-        parser.print_help()
+    with TMDBUpdater() as updater:
+        if args.update is not None:
+            if args.update is True:  # No ID provided
+                updater.update_all_movies(batch_size=args.batch_size, full_refresh=args.full_refresh)
+            else:  # ID provided
+                updater.update_existing_movie(args.update)
+        elif args.search:
+            updater.search_and_add_movie(args.search)
+        elif args.add_new_movies:
+            updater.add_new_movies(args.time_period, batch_size=args.batch_size)
+        else:
+            parser.print_help()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
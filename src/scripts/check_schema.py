@@ -40,6 +40,17 @@ def check_schema():
         # Get all tables
         tables = inspector.get_table_names()
         
+        # Count rows for every table in one query over one connection
+        row_counts = {}
+        if tables:
+            quote = engine.dialect.identifier_preparer.quote
+            count_sql = " UNION ALL ".join(
+                f"SELECT {i} AS table_index, COUNT(*) AS row_count FROM {quote(table)}"
+                for i, table in enumerate(tables)
+            )
+            with engine.connect() as connection:
+                row_counts = {tables[i]: count for i, count in connection.execute(text(count_sql))}
+        
         print("\n=== Database Schema Check ===")
         print(f"Database: {db_name}")
         print(f"Tables found: {len(tables)}\n")
@@ -74,10 +85,7 @@ def check_schema():
                              tablefmt='grid'))
             
             # Get row count
-            with engine.connect() as connection:
-                result = connection.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                row_count = result.scalar()
-                print(f"\nRow count: {row_count}")
+            print(f"\nRow count: {row_counts.get(table)}")
             
             print("\n" + "="*50)
         
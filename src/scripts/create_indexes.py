@@ -0,0 +1,70 @@
+import logging
+from typing import Dict, List, Tuple
+from sqlalchemy import text, inspect
+
+from src.database.db_manager import get_engine
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/schema.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Lookup indexes for the columns the ETL and sync jobs filter, join and sort on
+LOOKUP_INDEXES: Dict[str, List[Tuple[str, List[str]]]] = {
+    'movies': [
+        ('idx_movies_updated_at', ['updated_at']),  # update_all_movies: ORDER BY updated_at
+        ('idx_movies_release_date', ['release_date']),  # add_new_movies: MAX(release_date)
+    ],
+    'credits': [
+        ('idx_credits_movie_person', ['movie_id', 'person_id']),  # Per-movie credit replacement, covers cast lookups
+        ('idx_credits_person_id', ['person_id']),  # Person filmographies
+    ],
+    'genres': [
+        ('idx_genres_movie_genre', ['movie_id', 'genre_name']),  # Per-movie genre replacement, covers genre reads
+    ],
+}
+
+def create_indexes():
+    """Create any missing lookup indexes; existing indexes covering the same columns are kept."""
+    try:
+        # Shared engine, so the driver, charset and pool match the ETL and sync jobs
+        engine = get_engine()
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+        quote = engine.dialect.identifier_preparer.quote
+
+        with engine.connect() as connection:
+            for table, indexes in LOOKUP_INDEXES.items():
+                if table not in tables:
+                    logger.warning(f"Table {table} not found, skipping its indexes")
+                    continue
+
+                # An index (or the primary key) whose leading columns match already serves the lookup
+                existing = [idx['column_names'] for idx in inspector.get_indexes(table)]
+                existing.append(inspector.get_pk_constraint(table).get('constrained_columns', []))
+
+                for index_name, columns in indexes:
+                    if any(cols[:len(columns)] == columns for cols in existing):
+                        logger.info(f"{table}({', '.join(columns)}) already indexed")
+                        continue
+
+                    column_list = ', '.join(quote(column) for column in columns)
+                    connection.execute(text(f"CREATE INDEX {quote(index_name)} ON {quote(table)} ({column_list})"))
+                    existing.append(columns)
+                    logger.info(f"Created index {index_name} on {table}({', '.join(columns)})")
+            connection.commit()
+
+        logger.info("Index check completed successfully")
+
+    except Exception as e:
+        logger.error(f"Error creating indexes: {str(e)}")
+        raise
+
+if __name__ == "__main__":
+    create_indexes()